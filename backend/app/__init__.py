@@ -8,9 +8,11 @@ from .services import init_services
 from .routes import register_blueprints
 from .cli import register_cli_commands
 # Import models to register them with SQLAlchemy
-from .models import *  # This imports all models
+from . import models
 from .auth.models import User, APIKey
 
+_app = None
+
 
 def create_app():
     app = Flask(__name__)
@@ -46,4 +48,12 @@ def create_app():
     # CLI Commands
     register_cli_commands(app)
 
-    return app
\ No newline at end of file
+    return app
+
+
+def get_app():
+    """Return the process-wide app, creating it on first use."""
+    global _app
+    if _app is None:
+        _app = create_app()
+    return _app
@@ -1,13 +1,24 @@
 import os
 from dotenv import load_dotenv
-from app import create_app
+from app import get_app
 
 load_dotenv()
-app = create_app()
+app = get_app()
+
+# Per-request profiling; inspect the output with `snakeviz profiles/*.prof`.
+# This wraps the shared get_app() instance, not a private copy.
+if os.getenv('FLASK_PROFILE') == '1':
+    from werkzeug.middleware.profiler import ProfilerMiddleware
+    profile_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'profiles')
+    os.makedirs(profile_dir, exist_ok=True)
+    app.wsgi_app = ProfilerMiddleware(app.wsgi_app, restrictions=[30], profile_dir=profile_dir)
 
 if __name__ == "__main__":
     app.run(
         debug=os.getenv('FLASK_ENV') == 'development',
         host=os.getenv('FLASK_HOST', '127.0.0.1'),
-        port=int(os.getenv('FLASK_PORT', 5000))
+        port=int(os.getenv('FLASK_PORT', 5000)),
+        # cProfile allows one active profiler per process, so profile serially
+        threaded=os.getenv('FLASK_PROFILE') != '1',
+        use_reloader=os.getenv('FLASK_RELOAD') == '1'
     )
\ No newline at end of file